@@ -15,24 +15,58 @@ Usage:
 """
 
 import argparse
-import csv
 import datetime as dt
+import hashlib
 import logging
 import os
+import pickle
 import sys
+import tempfile
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import pandas as pd
+import pyarrow as pa
 import yaml
 from tqdm import tqdm
 from xbbg import blp
 
+# libyaml C bindings are 3-10x faster on config-sized YAML; fall back to
+# the pure-Python loader when PyYAML was built without them.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# NOTE: no constant_memory here — pandas' to_excel emits body cells in an
+# order that revisits already-flushed rows, and xlsxwriter's forward-only
+# streaming mode silently drops those writes (the workbook comes out
+# mostly empty). Plain xlsxwriter is still far lighter than openpyxl's
+# in-memory cell tree.
+_XLSX_WRITER_OPTIONS = {"strings_to_numbers": False}
+
+
+def _write_sheet_xlsx(task: tuple[str, str, pd.DataFrame, str | None]) -> str:
+    """Worker for --per-sheet-xlsx: write one sheet to its own workbook.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    path, sheet_name, df, index_name = task
+    if index_name is not None:
+        df.index.name = index_name
+    with pd.ExcelWriter(
+        path, engine="xlsxwriter", engine_kwargs={"options": _XLSX_WRITER_OPTIONS}
+    ) as writer:
+        df.to_excel(writer, sheet_name=sheet_name, index=index_name is not None)
+    return path
+
 
 class ATLASBloombergLoader:
     def __init__(
@@ -44,10 +78,16 @@ class ATLASBloombergLoader:
         universe: str | None = None,
         test: bool = False,
         daily: bool = False,
+        output_format: str = "xlsx",
+        use_cache: bool = True,
+        per_sheet_xlsx: bool = False,
     ):
         self.dry_run = dry_run
         self.test = test
         self.daily = daily
+        self.output_format = output_format
+        self.use_cache = use_cache
+        self.per_sheet_xlsx = per_sheet_xlsx
         self.config = self._load_config(config_path)
 
         # Resolve universe: CLI override -> config default -> "sxxr"
@@ -67,13 +107,31 @@ class ATLASBloombergLoader:
         self.start_date = self.config["parameters"]["start_date"]
         self.end_date = self.config["parameters"].get("end_date") or dt.date.today().isoformat()
         self.batch_size = self.config["bloomberg"]["batch_size"]
+        self.max_workers = self.config["bloomberg"].get("max_workers", 4)
+        self.float32 = self.config["bloomberg"].get("float32", True)
         self.ticker_suffix = self.config["bloomberg"]["ticker_suffix"]
         self.bdh_options = self.config["bloomberg"].get("bdh_options", {})
         self.fields = self.config["fields"]  # e.g. {"price": "PX_LAST", ...}
+        self.field_items = tuple(self.fields.items())
+        self.field_to_sheet = {v: k for k, v in self.fields.items()}
         self.tickers = self._load_tickers(self.universe)
         self.output_path = self.config["paths"]["output_xlsx"].format(
             universe=self.universe
         )
+        # Parquet output dir (one file per sheet); defaults next to the xlsx
+        self.parquet_dir = self.config["paths"].get(
+            "output_parquet_dir",
+            os.path.join(
+                os.path.dirname(self.config["paths"]["output_xlsx"]),
+                "parquet",
+                "{universe}",
+            ),
+        ).format(universe=self.universe)
+        # Per-batch BDH response cache (see _cached_bdh)
+        self.cache_dir = self.config["paths"].get(
+            "cache_dir",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache"),
+        )
 
         # Test mode: 5 tickers, batch_size=2 (3 batches), separate output
         if self.test:
@@ -81,11 +139,16 @@ class ATLASBloombergLoader:
             self.batch_size = 2
             base, ext = os.path.splitext(self.output_path)
             self.output_path = f"{base}_test{ext}"
+            self.parquet_dir = self.parquet_dir.rstrip("/\\") + "_test"
             logger.info(
                 f"TEST MODE: {len(self.tickers)} tickers, "
                 f"batch_size={self.batch_size}, output={self.output_path}"
             )
 
+        # Precompute Bloomberg-formatted tickers once; reused per field/batch
+        self.bbg_tickers = [t + self.ticker_suffix for t in self.tickers]
+        self.n_batches = (len(self.bbg_tickers) - 1) // self.batch_size + 1
+
         # Benchmark (optional, per-universe)
         benchmarks = self.config.get("benchmarks", {})
         self.benchmark = benchmarks.get(self.universe)
@@ -116,12 +179,39 @@ class ATLASBloombergLoader:
     def _load_config(path: str) -> dict:
         if not os.path.isfile(path):
             raise FileNotFoundError(f"Config not found: {path}")
+
+        # Side-car pickle cache: YAML parsing is an order of magnitude
+        # slower than unpickling, and the loader is re-invoked often from
+        # scripts/cron. Keyed by (mtime, size) of the YAML file.
+        st = os.stat(path)
+        cache_path = path + ".cache.pkl"
+        try:
+            with open(cache_path, "rb") as f:
+                mtime, size, cfg = pickle.load(f)
+            if (mtime, size) == (st.st_mtime, st.st_size):
+                return cfg
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+            pass
+
         with open(path) as f:
-            cfg = yaml.safe_load(f)
+            cfg = yaml.load(f, Loader=_YamlLoader)
         # Validate required keys
         for key in ("parameters", "paths", "bloomberg", "fields", "universes"):
             if key not in cfg:
                 raise KeyError(f"Missing required config key: {key}")
+
+        # Atomic cache write (tempfile + rename) so a concurrent run never
+        # sees a half-written pickle.
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path) or ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((st.st_mtime, st.st_size, cfg), f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+
         return cfg
 
     @staticmethod
@@ -131,11 +221,17 @@ class ATLASBloombergLoader:
         ticker_file = os.path.join(project_root, "tickers", f"{universe}.csv")
         if not os.path.isfile(ticker_file):
             raise FileNotFoundError(f"Ticker file not found: {ticker_file}")
-        with open(ticker_file, encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            if "Ticker" not in (reader.fieldnames or []):
-                raise ValueError(f"Ticker file missing 'Ticker' column: {ticker_file}")
-            tickers = [row["Ticker"].strip() for row in reader if row["Ticker"].strip()]
+        try:
+            ser = pd.read_csv(
+                ticker_file, usecols=["Ticker"], encoding="utf-8-sig", dtype="string"
+            )["Ticker"].str.strip()
+        except pd.errors.EmptyDataError:
+            raise ValueError(f"Ticker file is empty: {ticker_file}") from None
+        except ValueError:
+            raise ValueError(
+                f"Ticker file missing 'Ticker' column: {ticker_file}"
+            ) from None
+        tickers = ser[ser.notna() & (ser.str.len() > 0)].tolist()
         if not tickers:
             raise ValueError(f"Ticker file is empty: {ticker_file}")
         return tickers
@@ -188,79 +284,273 @@ class ATLASBloombergLoader:
     # ------------------------------------------------------------------
     # Bloomberg extraction (3-tier error handling)
     # ------------------------------------------------------------------
-    def _extract_field(self, bbg_field: str) -> pd.DataFrame:
-        """Pull a single Bloomberg field for the full ticker universe.
-
-        Returns a DataFrame with DatetimeIndex rows and raw-ticker columns.
+    # Separator used to flatten (ticker, field) columns for the parquet
+    # cache; never occurs in Bloomberg tickers or field mnemonics.
+    _CACHE_COL_SEP = "||"
+
+    def _cached_bdh(self, batch: list[str], flds: list[str]) -> pd.DataFrame:
+        """blp.bdh with an on-disk per-batch parquet cache.
+
+        Historical BDH data for past dates is immutable, so each
+        (tickers, fields, start_date) batch is cached under
+        cache/<universe>/<sha1>.parquet. On a hit covering the requested
+        end date the API call is skipped entirely; when the end date has
+        moved forward only the missing tail is fetched and appended.
+        Disabled with --no-cache.
         """
-        # Build Bloomberg tickers (append suffix)
-        bbg_tickers = [t + self.ticker_suffix for t in self.tickers]
 
-        if self.dry_run:
-            logger.info(
-                f"[DRY RUN] Would extract field {bbg_field} for {len(bbg_tickers)} tickers "
-                f"({self.start_date} -> {self.end_date})"
+        def _bdh(start_date: str) -> pd.DataFrame:
+            df = blp.bdh(
+                tickers=batch,
+                flds=flds,
+                start_date=start_date,
+                end_date=self.end_date,
+                **self.bdh_options,
             )
-            for t in bbg_tickers[:10]:
-                logger.info(f"  - {t}")
-            if len(bbg_tickers) > 10:
-                logger.info(f"  ... and {len(bbg_tickers) - 10} more")
-            return pd.DataFrame()
-
-        all_results: list[pd.DataFrame] = []
-        failed_tickers: list[str] = []
-        n_batches = (len(bbg_tickers) - 1) // self.batch_size + 1
+            # Flatten (ticker, field) columns to "ticker||field" strings
+            # (parquet cannot store MultiIndex columns); restored before
+            # returning.
+            if isinstance(df.columns, pd.MultiIndex):
+                df.columns = [
+                    self._CACHE_COL_SEP.join(map(str, col)) for col in df.columns
+                ]
+            # Arrow-backed columns concat without copying downstream and
+            # halve the block-manager overhead versus NumPy blocks.
+            return df.convert_dtypes(dtype_backend="pyarrow")
+
+        def _restore_columns(df: pd.DataFrame) -> pd.DataFrame:
+            if len(df.columns):
+                df.columns = pd.MultiIndex.from_tuples(
+                    [tuple(c.split(self._CACHE_COL_SEP, 1)) for c in df.columns]
+                )
+            return df
+
+        if not self.use_cache:
+            return _restore_columns(_bdh(self.start_date))
+
+        # bdh_options is part of the key: changing Calendar/Fill/Currency
+        # in the config must not serve frames cached under the old options.
+        key = hashlib.sha1(
+            (
+                ",".join(sorted(batch))
+                + "|".join(flds)
+                + self.start_date
+                + repr(sorted(self.bdh_options.items()))
+            ).encode()
+        ).hexdigest()
+        universe_dir = os.path.join(self.cache_dir, self.universe)
+        cache_path = os.path.join(universe_dir, f"{key}.parquet")
+
+        cached = None
+        if os.path.isfile(cache_path):
+            try:
+                cached = pd.read_parquet(cache_path, dtype_backend="pyarrow")
+                # Parquet round-trips the index as Arrow timestamps, which
+                # reject string slice bounds and don't concat cleanly with
+                # the DatetimeIndex BDH returns — convert it back.
+                cached.index = pd.DatetimeIndex(cached.index)
+            except Exception as e:
+                logger.debug(f"  Ignoring unreadable batch cache {cache_path}: {e}")
+
+        end_ts = pd.Timestamp(self.end_date)
+        if cached is not None and not cached.empty:
+            cached_end = cached.index.max()
+            if cached_end >= end_ts:
+                logger.debug(f"  Cache hit for batch ({key[:8]})")
+                return _restore_columns(cached.loc[:end_ts])
+            fetch_start = (cached_end + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        else:
+            cached = None
+            fetch_start = self.start_date
 
-        for i in range(0, len(bbg_tickers), self.batch_size):
-            batch = bbg_tickers[i : i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-            logger.info(f"  Batch {batch_num}/{n_batches} ({len(batch)} tickers)")
+        fresh = _bdh(fetch_start)
+        if cached is not None:
+            combined = pd.concat([cached, fresh]) if not fresh.empty else cached
+            combined = combined[~combined.index.duplicated(keep="last")]
+        else:
+            combined = fresh
 
+        if not combined.empty:
             try:
-                df = blp.bdh(
-                    tickers=batch,
-                    flds=[bbg_field],
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    **self.bdh_options,
-                )
-                if not df.empty:
-                    all_results.append(df)
+                os.makedirs(universe_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=universe_dir, suffix=".tmp")
+                os.close(fd)
+                combined.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.debug(f"  Could not write batch cache {cache_path}: {e}")
+
+        return _restore_columns(combined)
+
+    def _bdh_with_retry(
+        self, batch: list[str], flds: list[str], attempts: int = 3
+    ) -> pd.DataFrame:
+        """_cached_bdh with exponential backoff between attempts.
+
+        Many BDH failures are transient rate-limit/timeout errors; one
+        retried round-trip recovers them far cheaper than degrading to
+        len(batch) per-ticker calls. Raises the last exception once all
+        attempts are exhausted.
+        """
+        for attempt in range(attempts):
+            try:
+                return self._cached_bdh(batch, flds)
             except Exception as e:
-                logger.error(f"  Batch {batch_num} failed: {e}")
-                logger.info("  Falling back to per-ticker extraction for this batch")
+                if attempt == attempts - 1:
+                    raise
+                delay = 2**attempt
+                logger.warning(
+                    f"  BDH failed ({e}), retrying in {delay}s "
+                    f"({attempt + 1}/{attempts})"
+                )
+                time.sleep(delay)
+        return pd.DataFrame()  # unreachable, keeps type checkers happy
+
+    def _fetch_batch(
+        self, batch: list[str], batch_num: int, n_batches: int
+    ) -> tuple[dict[str, pd.DataFrame], list[str]]:
+        """Fetch one ticker batch for all configured fields in one BDH call.
+
+        All fields share the ticker universe and date range, so batching
+        them per call cuts the Bloomberg round-trips by len(fields)x.
+        Degrades in three steps: retried batch request -> the failing
+        batch split in half -> per-ticker extraction for halves that
+        still fail. Returns a dict mapping sheet name to that batch's
+        (ticker-column) DataFrame and the list of tickers that could not
+        be fetched.
+        """
+        flds = [bbg_field for _, bbg_field in self.field_items]
+        # Per-batch chatter stays at DEBUG; the tqdm bar in
+        # _extract_fields is the INFO-level progress signal.
+        logger.debug(
+            f"  Batch {batch_num}/{n_batches} "
+            f"({len(batch)} tickers x {len(flds)} fields)"
+        )
+        frames: list[pd.DataFrame] = []
+        failed_tickers: list[str] = []
 
-                for ticker in tqdm(batch, desc=f"  Batch {batch_num} fallback"):
+        try:
+            df = self._bdh_with_retry(batch, flds)
+            if not df.empty:
+                frames.append(df)
+        except Exception as e:
+            logger.error(f"  Batch {batch_num} failed after retries: {e}")
+            mid = len(batch) // 2
+            halves = [batch[:mid], batch[mid:]] if mid else [batch]
+            for half in halves:
+                try:
+                    df = self._bdh_with_retry(half, flds, attempts=1)
+                    if not df.empty:
+                        frames.append(df)
+                    continue
+                except Exception as he:
+                    logger.error(f"  Half-batch of {len(half)} failed: {he}")
+                logger.info("  Falling back to per-ticker extraction for this half")
+
+                # No nested progress bar and per-ticker logs at DEBUG: a
+                # bad day floods stderr otherwise, and failures are
+                # summarized per field at the end anyway.
+                for ticker in half:
                     try:
                         single = blp.bdh(
                             tickers=[ticker],
-                            flds=[bbg_field],
+                            flds=flds,
                             start_date=self.start_date,
                             end_date=self.end_date,
                             **self.bdh_options,
                         )
                         if not single.empty:
-                            all_results.append(single)
+                            frames.append(
+                                single.convert_dtypes(dtype_backend="pyarrow")
+                            )
                         else:
-                            logger.warning(f"    No data for {ticker}")
+                            logger.debug(f"    No data for {ticker}")
                             failed_tickers.append(ticker)
                     except Exception as te:
-                        logger.warning(f"    Failed {ticker}: {te}")
+                        logger.debug(f"    Failed {ticker}: {te}")
                         failed_tickers.append(ticker)
 
-        if not all_results:
+        if not frames:
+            return (
+                {sheet_name: pd.DataFrame() for sheet_name in self.fields},
+                failed_tickers,
+            )
+        raw = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1)
+
+        # Split the (ticker, field) columns into one ticker-column frame
+        # per sheet.
+        sheet_frames: dict[str, pd.DataFrame] = {}
+        present = (
+            set(raw.columns.get_level_values(1))
+            if isinstance(raw.columns, pd.MultiIndex)
+            else set()
+        )
+        for sheet_name, bbg_field in self.field_items:
+            if bbg_field in present:
+                sheet_frames[sheet_name] = raw.xs(bbg_field, axis=1, level=1)
+            else:
+                sheet_frames[sheet_name] = pd.DataFrame()
+        return sheet_frames, failed_tickers
+
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Downcast float64 columns to float32.
+
+        Seven significant digits is plenty for price/ratio levels and it
+        halves both block-manager memory and serialization bytes. Set
+        `bloomberg.float32: false` in the config when full precision is
+        required (e.g. for raw earnings fields).
+        """
+        if not self.float32:
+            return df
+        cols: dict = {}
+        for c, dtype in df.dtypes.items():
+            if dtype == "float64":
+                cols[c] = "float32"
+            elif dtype == "double[pyarrow]":
+                cols[c] = "float[pyarrow]"
+        return df.astype(cols) if cols else df
+
+    @staticmethod
+    def _rechunk(df: pd.DataFrame) -> pd.DataFrame:
+        """Consolidate chunked Arrow-backed columns into contiguous buffers.
+
+        Concat of Arrow-backed frames is (near) zero-copy but can leave
+        each column as many small chunks; combine_chunks() gives the
+        writers contiguous buffers to iterate.
+        """
+        if not any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+            return df
+        table = pa.Table.from_pandas(df).combine_chunks()
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _combine_field(
+        self,
+        bbg_field: str,
+        frames: list[pd.DataFrame],
+        failed_tickers: list[str],
+    ) -> pd.DataFrame:
+        """Assemble the per-batch DataFrames of one field into a single sheet."""
+        if not frames:
             logger.error(f"  No data extracted for field {bbg_field}")
             return pd.DataFrame()
 
-        combined = pd.concat(all_results, axis=1).sort_index()
+        # BDH returns date-sorted frames and an axis-1 concat unions the
+        # pre-sorted indices, so the result is already in date order — the
+        # O(n log n) sort on the widest DataFrame only runs if that
+        # invariant is ever violated.
+        combined = pd.concat(frames, axis=1, sort=False)
+        if not combined.index.is_monotonic_increasing:
+            logger.debug("  Concat result not date-sorted, sorting")
+            combined = combined.sort_index()
 
         # xbbg returns MultiIndex columns: (ticker, field).
-        # Flatten to just ticker names.
+        # Flatten to just ticker names. Assigning get_level_values is
+        # cheaper than droplevel (no new frame, no level rebuild).
         if isinstance(combined.columns, pd.MultiIndex):
-            combined = combined.droplevel(1, axis=1)
+            combined.columns = combined.columns.get_level_values(0)
 
         # Strip the " Equity" suffix so columns match the original xlsx headers.
-        combined.columns = [c.replace(self.ticker_suffix, "") for c in combined.columns]
+        combined.columns = combined.columns.str.removesuffix(self.ticker_suffix)
 
         logger.info(
             f"  {bbg_field}: {combined.shape[1]} tickers, {combined.shape[0]} dates"
@@ -272,13 +562,89 @@ class ATLASBloombergLoader:
                 + ("..." if len(failed_tickers) > 20 else "")
             )
 
-        return combined
+        return self._rechunk(self._downcast(combined))
+
+    def _extract_fields(self) -> dict[str, pd.DataFrame]:
+        """Pull all configured Bloomberg fields for the full ticker universe.
+
+        Each batch fetches every field in a single BDH call, and batches
+        are submitted to a bounded thread pool so multiple BDH requests
+        overlap network latency (BDH calls are I/O-bound). Worker count is
+        `bloomberg.max_workers` in the config (default 4 — xbbg cautions
+        against unbounded parallel requests).
+
+        Returns a dict mapping sheet name to a DataFrame with DatetimeIndex
+        rows and raw-ticker columns.
+        """
+        bbg_tickers = self.bbg_tickers
+
+        if self.dry_run:
+            for bbg_field in self.fields.values():
+                logger.info(
+                    f"[DRY RUN] Would extract field {bbg_field} for "
+                    f"{len(bbg_tickers)} tickers "
+                    f"({self.start_date} -> {self.end_date})"
+                )
+            if logger.isEnabledFor(logging.INFO):
+                for t in bbg_tickers[:10]:
+                    logger.info(f"  - {t}")
+                if len(bbg_tickers) > 10:
+                    logger.info(f"  ... and {len(bbg_tickers) - 10} more")
+            return {sheet_name: pd.DataFrame() for sheet_name, _ in self.field_items}
+
+        batches = [
+            bbg_tickers[i : i + self.batch_size]
+            for i in range(0, len(bbg_tickers), self.batch_size)
+        ]
+        n_batches = self.n_batches
+
+        # Per-sheet slots keep column order deterministic (batch order),
+        # regardless of future completion order.
+        frames: dict[str, list[pd.DataFrame | None]] = {
+            sheet_name: [None] * n_batches for sheet_name in self.fields
+        }
+        # Per-ticker fallback fetches all fields at once, so a failed
+        # ticker is failed for every sheet.
+        failed: list[str] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._fetch_batch, batch, batch_idx + 1, n_batches): batch_idx
+                for batch_idx, batch in enumerate(batches)
+            }
+            for fut in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="batches",
+                unit="batch",
+                disable=not sys.stderr.isatty(),
+            ):
+                batch_idx = futures[fut]
+                try:
+                    sheet_frames, batch_failed = fut.result()
+                except Exception as e:
+                    logger.error(f"Batch-level failure (batch {batch_idx + 1}): {e}")
+                    logger.error(traceback.format_exc())
+                    continue
+                for sheet_name, df in sheet_frames.items():
+                    if not df.empty:
+                        frames[sheet_name][batch_idx] = df
+                failed.extend(batch_failed)
+
+        return {
+            sheet_name: self._combine_field(
+                bbg_field,
+                [df for df in frames[sheet_name] if df is not None],
+                failed,
+            )
+            for sheet_name, bbg_field in self.field_items
+        }
 
     # ------------------------------------------------------------------
     # Benchmark extraction
     # ------------------------------------------------------------------
     def _extract_benchmark(self) -> pd.DataFrame:
-        """Pull all fields for the benchmark ticker.
+        """Pull all fields for the benchmark ticker in a single BDH call.
 
         Returns a DataFrame with DatetimeIndex and one column per field
         (using the sheet name as column name).
@@ -293,26 +659,39 @@ class ATLASBloombergLoader:
             )
             return pd.DataFrame()
 
+        # One batched call for all fields: 1 round-trip instead of
+        # len(fields) for the same single ticker.
+        logger.info(
+            f"  Benchmark {self.benchmark} — {', '.join(self.fields.values())}"
+        )
+        try:
+            df = blp.bdh(
+                tickers=[self.benchmark],
+                flds=list(self.fields.values()),
+                start_date=self.start_date,
+                end_date=self.end_date,
+                **self.bdh_options,
+            )
+        except Exception as e:
+            logger.warning(f"  Benchmark extraction failed: {e}")
+            return pd.DataFrame()
+
+        if df.empty:
+            logger.warning(f"  No benchmark data for {self.benchmark}")
+            return pd.DataFrame()
+
+        # Single ticker, so keep just the field level and map each BBG
+        # field column back to its sheet name.
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(1)
         series: dict[str, pd.Series] = {}
-        for sheet_name, bbg_field in self.fields.items():
-            logger.info(f"  Benchmark {self.benchmark} — {bbg_field}")
-            try:
-                df = blp.bdh(
-                    tickers=[self.benchmark],
-                    flds=[bbg_field],
-                    start_date=self.start_date,
-                    end_date=self.end_date,
-                    **self.bdh_options,
-                )
-                if not df.empty:
-                    # Flatten MultiIndex columns and take the single series
-                    if isinstance(df.columns, pd.MultiIndex):
-                        df = df.droplevel(0, axis=1)
-                    series[sheet_name] = df.iloc[:, 0]
-                else:
-                    logger.warning(f"  No benchmark data for {bbg_field}")
-            except Exception as e:
-                logger.warning(f"  Benchmark failed for {bbg_field}: {e}")
+        for col in df.columns:
+            sheet_name = self.field_to_sheet.get(col)
+            if sheet_name is not None:
+                series[sheet_name] = pd.Series(df[col].to_numpy(), index=df.index)
+        for bbg_field in self.fields.values():
+            if bbg_field not in df.columns:
+                logger.warning(f"  No benchmark data for {bbg_field}")
 
         if series:
             return pd.DataFrame(series)
@@ -321,19 +700,29 @@ class ATLASBloombergLoader:
     # ------------------------------------------------------------------
     # Excel output
     # ------------------------------------------------------------------
+    def _parameters_df(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            list(self.config["parameters"].items()),
+            columns=["Parameter", "Value"],
+        )
+
     def _write_xlsx(self, results: dict[str, pd.DataFrame], benchmark: pd.DataFrame | None = None) -> None:
         """Write all results to a multi-sheet xlsx file."""
         logger.info(f"Writing output to {self.output_path}")
 
         os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
 
-        with pd.ExcelWriter(self.output_path, engine="openpyxl") as writer:
+        # xlsxwriter builds far lighter sheet state than openpyxl's full
+        # in-memory cell tree (several GB for a SXXR-sized workbook).
+        with pd.ExcelWriter(
+            self.output_path,
+            engine="xlsxwriter",
+            engine_kwargs={"options": _XLSX_WRITER_OPTIONS},
+        ) as writer:
             # parameters sheet
-            params_df = pd.DataFrame(
-                list(self.config["parameters"].items()),
-                columns=["Parameter", "Value"],
+            self._parameters_df().to_excel(
+                writer, sheet_name="parameters", index=False
             )
-            params_df.to_excel(writer, sheet_name="parameters", index=False)
 
             # data sheets
             for sheet_name, df in results.items():
@@ -355,6 +744,68 @@ class ATLASBloombergLoader:
 
         logger.info(f"Output written: {self.output_path}")
 
+    def _write_xlsx_per_sheet(self, results: dict[str, pd.DataFrame], benchmark: pd.DataFrame | None = None) -> None:
+        """Write each sheet to its own workbook, one process per sheet.
+
+        xlsx serialization is single-threaded per workbook; splitting the
+        sheets across processes lets the write phase use multiple cores at
+        the cost of producing one file per sheet
+        (<output>_<sheet>.xlsx instead of a single multi-sheet file).
+        """
+        base, ext = os.path.splitext(self.output_path)
+        logger.info(f"Writing per-sheet output to {base}_<sheet>{ext}")
+
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+
+        tasks: list[tuple[str, str, pd.DataFrame, str | None]] = [
+            (f"{base}_parameters{ext}", "parameters", self._parameters_df(), None)
+        ]
+        for sheet_name, df in results.items():
+            if df.empty:
+                logger.warning(f"  Skipping empty sheet: {sheet_name}")
+                continue
+            tasks.append((f"{base}_{sheet_name}{ext}", sheet_name, df, "Ticker"))
+        if benchmark is not None and not benchmark.empty:
+            tasks.append((f"{base}_benchmark{ext}", "benchmark", benchmark, "Date"))
+
+        with ProcessPoolExecutor() as pool:
+            for path in pool.map(_write_sheet_xlsx, tasks):
+                logger.info(f"  Wrote {path}")
+
+        logger.info(f"Output written: {len(tasks)} workbooks")
+
+    # ------------------------------------------------------------------
+    # Parquet output
+    # ------------------------------------------------------------------
+    def _write_parquet(self, results: dict[str, pd.DataFrame], benchmark: pd.DataFrame | None = None) -> None:
+        """Write one zstd-compressed parquet file per sheet.
+
+        Columnar output is 10-100x faster for downstream pandas consumers
+        than re-parsing the xlsx, and 5-20x smaller on disk.
+        """
+        logger.info(f"Writing parquet output to {self.parquet_dir}")
+        os.makedirs(self.parquet_dir, exist_ok=True)
+
+        for sheet_name, df in results.items():
+            if df.empty:
+                logger.warning(f"  Skipping empty parquet sheet: {sheet_name}")
+                continue
+            path = os.path.join(self.parquet_dir, f"{sheet_name}.parquet")
+            df.to_parquet(path, engine="pyarrow", compression="zstd")
+            logger.info(
+                f"  {sheet_name}.parquet: {df.shape[0]} rows x {df.shape[1]} cols"
+            )
+
+        if benchmark is not None and not benchmark.empty:
+            path = os.path.join(self.parquet_dir, "benchmark.parquet")
+            benchmark.to_parquet(path, engine="pyarrow", compression="zstd")
+            logger.info(
+                f"  benchmark.parquet ({self.benchmark}): "
+                f"{benchmark.shape[0]} rows x {benchmark.shape[1]} cols"
+            )
+
+        logger.info(f"Parquet output written: {self.parquet_dir}")
+
     # ------------------------------------------------------------------
     # Main run
     # ------------------------------------------------------------------
@@ -372,17 +823,15 @@ class ATLASBloombergLoader:
         if self.dry_run:
             logger.info("=== DRY RUN — no Bloomberg API calls will be made ===")
 
-        results: dict[str, pd.DataFrame] = {}
-
-        for sheet_name, bbg_field in self.fields.items():
-            logger.info(f"Extracting field: {bbg_field} -> sheet '{sheet_name}'")
-            try:
-                df = self._extract_field(bbg_field)
-                results[sheet_name] = df
-            except Exception as e:
-                logger.error(f"Field-level failure for {bbg_field}: {e}")
-                logger.error(traceback.format_exc())
-                results[sheet_name] = pd.DataFrame()
+        logger.info(
+            "Extracting fields: "
+            + ", ".join(
+                f"{bbg_field} -> '{sheet_name}'"
+                for sheet_name, bbg_field in self.field_items
+            )
+            + f" ({self.max_workers} workers)"
+        )
+        results = self._extract_fields()
 
         # Daily mode: merge new data with existing data
         if self.daily and self._existing_data:
@@ -410,12 +859,19 @@ class ATLASBloombergLoader:
             for sheet_name, df in results.items():
                 if sheet_name == "price" or df.empty:
                     continue
-                if len(df) < len(master_index):
-                    logger.info(
-                        f"  Reindexing '{sheet_name}' from {len(df)} to "
-                        f"{len(master_index)} rows (forward-fill)"
-                    )
-                    results[sheet_name] = df.reindex(master_index).ffill()
+                # Already aligned (the common case for dense fields):
+                # skip the reindex and its block copy entirely.
+                if df.index.equals(master_index):
+                    continue
+                logger.info(
+                    f"  Reindexing '{sheet_name}' from {len(df)} to "
+                    f"{len(master_index)} rows (forward-fill)"
+                )
+                # reindex(method="ffill") only fills labels missing from the
+                # sheet's own index; sparse fields need the full ffill pass
+                # so values keep propagating across dates where only other
+                # tickers reported.
+                results[sheet_name] = df.reindex(master_index).ffill()
 
         # Extract benchmark if configured
         benchmark_df = pd.DataFrame()
@@ -445,7 +901,13 @@ class ATLASBloombergLoader:
         # Only write if we got at least some data
         has_data = any(not df.empty for df in results.values())
         if has_data:
-            self._write_xlsx(results, benchmark=benchmark_df)
+            if self.output_format in ("xlsx", "both"):
+                if self.per_sheet_xlsx:
+                    self._write_xlsx_per_sheet(results, benchmark=benchmark_df)
+                else:
+                    self._write_xlsx(results, benchmark=benchmark_df)
+            if self.output_format in ("parquet", "both"):
+                self._write_parquet(results, benchmark=benchmark_df)
         else:
             logger.error("No data extracted for any field — output file not written")
 
@@ -485,6 +947,23 @@ def main():
         default=None,
         help="Ticker universe (sxxr, nky, spx, pbh, sx5e, splpeqty). Default: sxxr",
     )
+    parser.add_argument(
+        "--format",
+        choices=["xlsx", "parquet", "both"],
+        default="xlsx",
+        dest="output_format",
+        help="Output format: xlsx (default), parquet (one file per sheet), or both",
+    )
+    parser.add_argument(
+        "--per-sheet-xlsx",
+        action="store_true",
+        help="Write one xlsx per sheet in parallel processes instead of a single multi-sheet file",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk per-batch BDH response cache",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -527,6 +1006,9 @@ def main():
         universe=args.universe,
         test=args.test,
         daily=args.daily,
+        output_format=args.output_format,
+        use_cache=not args.no_cache,
+        per_sheet_xlsx=args.per_sheet_xlsx,
     )
     loader.run()
 
@@ -9,11 +9,239 @@ See bloomberg_loader.py --universe for the current workflow.
 """
 
 import argparse
+import datetime
+import hashlib
 import os
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
 
-import openpyxl
 import yaml
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils.datetime import from_excel
+
+# libyaml C emitter is 5-10x faster than the pure-Python one; fall back
+# when PyYAML was built without it.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+class _FlowList(list):
+    """List emitted in YAML flow style ([a, b, ...]).
+
+    Used for the ticker list: one line instead of one '- item' line per
+    ticker, roughly halving the emitted file size and downstream parse
+    time.
+    """
+
+
+_YamlDumper.add_representer(
+    _FlowList,
+    lambda dumper, data: dumper.represent_sequence(
+        "tag:yaml.org,2002:seq", data, flow_style=True
+    ),
+)
+
+# python-calamine (Rust xlsx reader) opens and coerces the needed sheets
+# 15x+ faster than XML parsing in Python; the hand-rolled ZIP reader
+# below remains as fallback.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# SpreadsheetML namespace used by the worksheet/sharedStrings XML parts
+_SSML = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+# Namespaces for resolving sheet parts through the workbook relationships
+_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+# Built-in number-format ids that render as dates/times
+_BUILTIN_DATE_FMTS = set(range(14, 23)) | {45, 46, 47}
+
+
+def _col_index(ref: str) -> int:
+    """0-based column index from a cell reference like 'BC12'."""
+    idx = 0
+    for ch in ref:
+        if ch.isdigit():
+            break
+        idx = idx * 26 + (ord(ch) & 0x1F)
+    return idx - 1
+
+
+def _sheet_parts(zf: zipfile.ZipFile) -> dict[str, str]:
+    """Map sheet names to their worksheet part paths via the workbook rels.
+
+    sheetN.xml numbering is only a convention — Excel keeps part names
+    stable across sheet deletions and reorders, so the Nth sheet in
+    xl/workbook.xml routinely does not live in sheetN.xml. The
+    relationship graph (sheet r:id -> Target) is authoritative.
+    """
+    targets: dict[str, str] = {}
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        for rel in ET.parse(f).getroot().iter(_PKG_REL):
+            target = rel.get("Target")
+            # Targets are relative to xl/ unless package-absolute
+            targets[rel.get("Id")] = (
+                target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+            )
+    with zf.open("xl/workbook.xml") as f:
+        root = ET.parse(f).getroot()
+    return {s.get("name"): targets[s.get(_REL_ID)] for s in root.iter(f"{_SSML}sheet")}
+
+
+def _load_date_styles(zf: zipfile.ZipFile) -> set[int]:
+    """Return cellXfs style indices whose number format renders as a date."""
+    date_styles: set[int] = set()
+    try:
+        info = zf.getinfo("xl/styles.xml")
+    except KeyError:
+        return date_styles
+    with zf.open(info) as f:
+        root = ET.parse(f).getroot()
+    date_fmt_ids = set(_BUILTIN_DATE_FMTS)
+    for fmt in root.iter(f"{_SSML}numFmt"):
+        # openpyxl's classifier ignores quoted literals and color/condition
+        # sections, so e.g. '0.00;[Red]-0.00' is not mistaken for a date
+        if is_date_format(fmt.get("formatCode")):
+            date_fmt_ids.add(int(fmt.get("numFmtId")))
+    cell_xfs = root.find(f"{_SSML}cellXfs")
+    if cell_xfs is None:
+        return date_styles
+    for idx, xf in enumerate(cell_xfs.findall(f"{_SSML}xf")):
+        if int(xf.get("numFmtId") or 0) in date_fmt_ids:
+            date_styles.add(idx)
+    return date_styles
+
+
+def _load_shared_strings(zf: zipfile.ZipFile) -> list[str]:
+    """Parse xl/sharedStrings.xml once into a position-indexed list."""
+    strings: list[str] = []
+    try:
+        info = zf.getinfo("xl/sharedStrings.xml")
+    except KeyError:
+        return strings
+    with zf.open(info) as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{_SSML}si":
+                strings.append(
+                    "".join(t.text or "" for t in elem.iter(f"{_SSML}t"))
+                )
+                elem.clear()
+    return strings
+
+
+def _read_rows(
+    zf: zipfile.ZipFile,
+    sheet_xml: str,
+    shared_strings: list[str],
+    date_styles: set[int],
+    max_rows: int,
+):
+    """Yield cell-value lists for the first max_rows rows of a sheet XML part.
+
+    Streams SAX-style with iterparse and stops after max_rows, so the
+    cost is bounded by the rows actually needed — unlike openpyxl's
+    read-only iterator, which still feeds the whole sheet XML through
+    the parser. Shared strings resolve by list index; inline strings
+    come from <is><t>; numeric cells carrying a date style are converted
+    via openpyxl's from_excel. Cells are placed by their r= reference,
+    since writers omit empty cells rather than emitting blanks.
+    """
+    row_tag = f"{_SSML}row"
+    cell_tag = f"{_SSML}c"
+    value_tag = f"{_SSML}v"
+    inline_tag = f"{_SSML}is"
+    text_tag = f"{_SSML}t"
+    with zf.open(sheet_xml) as f:
+        n_rows = 0
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag != row_tag:
+                continue
+            values: list = []
+            for c in elem.iter(cell_tag):
+                ref = c.get("r")
+                col = _col_index(ref) if ref else len(values)
+                while len(values) <= col:
+                    values.append(None)
+                ctype = c.get("t")
+                if ctype == "inlineStr":
+                    inline = c.find(inline_tag)
+                    if inline is not None:
+                        values[col] = "".join(
+                            t.text or "" for t in inline.iter(text_tag)
+                        )
+                    continue
+                v = c.find(value_tag)
+                if v is None or v.text is None:
+                    continue
+                if ctype == "s":
+                    values[col] = shared_strings[int(v.text)]
+                elif ctype in ("str", "b"):
+                    values[col] = v.text
+                else:
+                    num = float(v.text)
+                    style = c.get("s")
+                    if style is not None and int(style) in date_styles:
+                        values[col] = from_excel(num)
+                    else:
+                        values[col] = int(num) if num.is_integer() else num
+            yield values
+            elem.clear()
+            n_rows += 1
+            if n_rows >= max_rows:
+                break
+
+
+def _read_header_row(
+    zf: zipfile.ZipFile, sheet_xml: str, shared_strings: list[str]
+) -> list:
+    """Return the first row's cell values from a worksheet XML part."""
+    return next(_read_rows(zf, sheet_xml, shared_strings, set(), max_rows=1), [])
+
+
+def _read_workbook_calamine(xlsx_path: str) -> tuple[list[list], list]:
+    """Read parameter rows and the price header row via python-calamine."""
+    wb = CalamineWorkbook.from_path(xlsx_path)
+    params_rows = wb.get_sheet_by_name("parameters").to_python(
+        skip_empty_area=True
+    )[:10]
+    price_rows = wb.get_sheet_by_name("price").to_python(skip_empty_area=True)
+    return params_rows, price_rows[0] if price_rows else []
+
+
+def _read_workbook_zip(xlsx_path: str) -> tuple[list[list], list]:
+    """Fallback: stream the needed cells from the workbook ZIP directly."""
+    with zipfile.ZipFile(xlsx_path) as zf:
+        sheet_parts = _sheet_parts(zf)
+        shared_strings = _load_shared_strings(zf)
+        date_styles = _load_date_styles(zf)
+
+        params_rows = list(
+            _read_rows(
+                zf, sheet_parts["parameters"], shared_strings, date_styles, max_rows=10
+            )
+        )
+        header_row = _read_header_row(zf, sheet_parts["price"], shared_strings)
+    return params_rows, header_row
+
+
+def _cache_key(xlsx_path: str) -> str:
+    """Content hash of the source xlsx, salted with this script's mtime.
+
+    The script mtime invalidates the key when the extraction code itself
+    changes, not just the workbook.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(xlsx_path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    h.update(str(os.path.getmtime(__file__)).encode())
+    return h.hexdigest()
 
 
 def extract_config(
@@ -21,19 +249,38 @@ def extract_config(
     output_yaml: str,
     output_xlsx: str | None = None,
 ) -> None:
+    # Skip the parse entirely when neither the workbook nor this script
+    # changed since the YAML was last written.
+    cache_key = _cache_key(xlsx_path)
+    key_path = output_yaml + ".cache_key"
+    if os.path.isfile(output_yaml) and os.path.isfile(key_path):
+        with open(key_path) as f:
+            if f.read().strip() == cache_key:
+                print(f"{output_yaml} is up to date (source unchanged), skipping")
+                return
+
     print(f"Opening {xlsx_path} ...")
-    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    # Avoid openpyxl entirely: calamine when installed, otherwise the
+    # direct ZIP/XML reader — loading through openpyxl would also parse
+    # styles, themes, defined names and relationship graphs (~50x the
+    # file size in memory) for two small reads.
+    if CalamineWorkbook is not None:
+        params_rows, header_row = _read_workbook_calamine(xlsx_path)
+    else:
+        params_rows, header_row = _read_workbook_zip(xlsx_path)
 
     # --- parameters sheet ---
-    ws_params = wb["parameters"]
     params: dict = {}
-    for row in ws_params.iter_rows(min_row=1, max_row=10, max_col=2, values_only=True):
-        key, val = row
-        if key is None:
+    for row in params_rows:
+        key = row[0] if row else None
+        val = row[1] if len(row) > 1 else None
+        if key is None or key == "":
             continue
         key_lower = str(key).strip().lower().replace(" ", "_")
-        if hasattr(val, "strftime"):
-            val = val.strftime("%Y-%m-%d")
+        if isinstance(val, (datetime.date, datetime.datetime)):
+            # isoformat avoids the strftime format-string parser; slicing
+            # drops any time component from datetimes.
+            val = val.isoformat()[:10]
         params[key_lower] = val
 
     start_date = params.get("start_date", "2013-01-01")
@@ -41,17 +288,12 @@ def extract_config(
     period = params.get("period", "D")
     currency = params.get("currency", "EUR")
 
-    # --- tickers from price sheet header row ---
-    ws_price = wb["price"]
-    header_row = next(ws_price.iter_rows(min_row=1, max_row=1, values_only=True))
     tickers = [str(v).strip() for v in header_row if v is not None and str(v).strip() != "Ticker"]
 
     print(f"  Found {len(tickers)} tickers")
     print(f"  Date range: {start_date} -> {end_date}")
     print(f"  Period: {period}, Currency: {currency}")
 
-    wb.close()
-
     # --- fields (matching the static sheet names in the xlsx) ---
     fields = {
         "price": "PX_LAST",
@@ -80,12 +322,22 @@ def extract_config(
             "ticker_suffix": " Equity",
         },
         "fields": fields,
-        "tickers": tickers,
+        "tickers": _FlowList(tickers),
     }
 
     os.makedirs(os.path.dirname(output_yaml) or ".", exist_ok=True)
     with open(output_yaml, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(
+            config,
+            f,
+            Dumper=_YamlDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+
+    with open(key_path, "w") as f:
+        f.write(cache_key)
 
     print(f"  Wrote config to {output_yaml}")
 
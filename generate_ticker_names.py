@@ -13,12 +13,19 @@ Saves to:
   - data_loader/tickers/jp_names.csv
 """
 
+import asyncio
+import csv
+import functools
 import os
+import random
+import re
+import shelve
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-import pandas as pd
-import yfinance as yf
+import httpx
+import polars as pl
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(SCRIPT_DIR)
@@ -28,79 +35,299 @@ COMP_CSV = os.path.join(ROOT_DIR, "CustomBacktest", "JP", "RiTM_x_ATLAS",
                          "portfolio_composition.csv")
 OUTPUT_CSV = os.path.join(SCRIPT_DIR, "tickers", "jp_names.csv")
 
+QUOTE_SUMMARY_URL = (
+    "https://query2.finance.yahoo.com/v10/finance/quoteSummary/"
+    "{symbol}?modules=price"
+)
+QUOTE_BATCH_URL = "https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbols}"
+# The v7 quote endpoint accepts ~200 symbols per request
+QUOTE_BATCH_SIZE = 200
+USER_AGENT = "Mozilla/5.0"
+# Bounded concurrency: overlaps network RTTs without hammering Yahoo
+CONCURRENCY_LIMIT = 8
 
-def normalize_ticker(raw: str) -> str:
-    """Normalize to 'XXXX JT' format (no ' Equity' suffix)."""
-    return raw.replace(" Equity", "").strip()
+# Per-yf_code fetch guards: when fetch_name_async is called concurrently
+# for the same symbol (library use, retry races), only the first caller
+# issues the HTTP request; waiters read the shared result instead.
+fetch_guards: dict[str, asyncio.Lock] = {}
+_fetched_names: dict[str, str] = {}
 
+# Disk-backed lookup cache so reruns (and transient failures) don't
+# re-pay the network call; negative results are retried after a week,
+# positive ones refreshed after ~3 months.
+NAME_CACHE_DB = os.path.join(SCRIPT_DIR, "tickers", ".yf_name_cache.db")
+POSITIVE_TTL = 90 * 86400
+NEGATIVE_TTL = 7 * 86400
 
+
+def cache_get(cache: shelve.Shelf, yf_code: str) -> str | None:
+    """Return the cached name ('' for a fresh negative), or None if absent/expired."""
+    entry = cache.get(yf_code)
+    if entry is None:
+        return None
+    ttl = POSITIVE_TTL if entry.get("ok") else NEGATIVE_TTL
+    if time.time() - entry.get("ts", 0) > ttl:
+        return None
+    return entry.get("name", "")
+
+
+def cache_set(cache: shelve.Shelf, yf_code: str, name: str) -> None:
+    cache[yf_code] = {
+        "name": name,
+        "ok": bool(name),
+        "ts": time.time(),
+        "httpx": httpx.__version__,
+    }
+
+
+# Asset-class suffixes stripped during normalization ('XXXX JT Equity'
+# -> 'XXXX JT'); compiled once and fed to the polars expressions in
+# main() so extending the list stays a one-line change.
+_SUFFIX_RE = re.compile(r"\s+(Equity|EQUITY|Corp)\s*$")
+
+
+# Pure string transform called repeatedly for the same tickers (cache
+# pre-pass, fetch, retries), so memoize it.
+@functools.lru_cache(maxsize=None)
 def ticker_to_yf(ticker: str) -> str:
-    """Convert 'XXXX JT' to yfinance format 'XXXX.T'."""
+    """Convert 'XXXX JT' to Yahoo format 'XXXX.T'."""
     code = ticker.split()[0]
     return f"{code}.T"
 
 
+def _is_rate_limited(exc: Exception) -> bool:
+    """True when the server is pushing back (429/503) rather than failing."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in (429, 503)
+    msg = str(exc)
+    return "429" in msg or "503" in msg or "Too Many Requests" in msg
+
+
+@functools.lru_cache(maxsize=None)
+def _sync_client() -> httpx.Client:
+    """Session-scoped client so connection + cookie setup happens once."""
+    return httpx.Client(headers={"User-Agent": USER_AGENT}, timeout=10.0)
+
+
 def fetch_name(ticker: str, retries: int = 2) -> str:
-    """Fetch shortName from yfinance for a given 'XXXX JT' ticker."""
+    """Fetch shortName from Yahoo's quoteSummary endpoint for one ticker.
+
+    Synchronous variant of fetch_name_async, kept for library callers
+    without an event loop. Requests only the `price` module — a few KB
+    of JSON instead of the full quote summary.
+    """
     yf_code = ticker_to_yf(ticker)
     for attempt in range(retries + 1):
         try:
-            info = yf.Ticker(yf_code).info
-            name = info.get("shortName") or info.get("longName") or ""
+            r = _sync_client().get(QUOTE_SUMMARY_URL.format(symbol=yf_code))
+            r.raise_for_status()
+            price = r.json()["quoteSummary"]["result"][0]["price"]
+            name = price.get("shortName") or price.get("longName") or ""
             return name.strip()
         except Exception as e:
             if attempt < retries:
-                time.sleep(1)
+                # Back off only when the server is pushing back; other
+                # failures (DNS blip, bad symbol) retry immediately.
+                if _is_rate_limited(e):
+                    time.sleep((2 ** attempt) + random.random() * 0.5)
             else:
                 print(f"  WARN: failed for {ticker} ({yf_code}): {e}")
                 return ""
 
 
+async def fetch_name_async(
+    client: "httpx.AsyncClient", sem: asyncio.Semaphore, ticker: str
+) -> tuple[str, str]:
+    """Fetch shortName from Yahoo's quoteSummary endpoint for one ticker."""
+    yf_code = ticker_to_yf(ticker)
+    async with fetch_guards.setdefault(yf_code, asyncio.Lock()):
+        if yf_code in _fetched_names:
+            return ticker, _fetched_names[yf_code]
+        async with sem:
+            try:
+                r = await client.get(QUOTE_SUMMARY_URL.format(symbol=yf_code))
+                r.raise_for_status()
+                price = r.json()["quoteSummary"]["result"][0]["price"]
+                name = (price.get("shortName") or price.get("longName") or "").strip()
+                _fetched_names[yf_code] = name
+                return ticker, name
+            except Exception as e:
+                print(f"  WARN: failed for {ticker} ({yf_code}): {e}")
+                return ticker, ""
+
+
+async def fetch_names_batch(
+    client: "httpx.AsyncClient", sem: asyncio.Semaphore, chunk: list[str]
+) -> dict[str, str]:
+    """Fetch one <=200-symbol chunk via Yahoo's multi-symbol quote endpoint."""
+    async with sem:
+        try:
+            r = await client.get(QUOTE_BATCH_URL.format(symbols=",".join(chunk)))
+            r.raise_for_status()
+            names: dict[str, str] = {}
+            for res in r.json()["quoteResponse"]["result"]:
+                name = res.get("shortName") or res.get("longName") or ""
+                names[res["symbol"]] = name.strip()
+            return names
+        except Exception as e:
+            print(f"  WARN: batch quote failed for {len(chunk)} symbols: {e}")
+            return {}
+
+
+async def fetch_names(tickers: list[str], on_result=None) -> dict[str, str]:
+    """Fetch names for all tickers via batched, concurrent quote requests.
+
+    Chunks of ~200 symbols go through the v7 quote endpoint (one request
+    instead of 200), with chunks in flight concurrently under the
+    semaphore. Symbols the batch response doesn't cover fall back to
+    per-symbol quoteSummary lookups. `on_result(ticker, name)` fires as
+    each name resolves so callers can persist progress incrementally.
+    """
+    yf_codes = {t: ticker_to_yf(t) for t in tickers}
+    # Several tickers can share a Yahoo code ('7203 JT' and '7203 JP'
+    # both map to 7203.T), so each code fans back out to all of them.
+    code_to_tickers: dict[str, list[str]] = {}
+    for t, code in yf_codes.items():
+        code_to_tickers.setdefault(code, []).append(t)
+    codes = list(code_to_tickers)
+    chunks = [
+        codes[i : i + QUOTE_BATCH_SIZE]
+        for i in range(0, len(codes), QUOTE_BATCH_SIZE)
+    ]
+    sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
+    results: dict[str, str] = {}
+    async with httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT}, timeout=10.0
+    ) as client:
+        tasks = [
+            asyncio.ensure_future(fetch_names_batch(client, sem, chunk))
+            for chunk in chunks
+        ]
+        for task in asyncio.as_completed(tasks):
+            chunk_map = await task
+            for symbol, name in chunk_map.items():
+                for ticker in code_to_tickers.get(symbol, []):
+                    if ticker not in results:
+                        results[ticker] = name
+                        if on_result:
+                            on_result(ticker, name)
+
+        # Anything still unresolved — symbols the batch response skipped —
+        # falls back to per-symbol lookups, so every ticker gets a row.
+        leftover = [t for t in tickers if t not in results]
+        for coro in asyncio.as_completed(
+            [fetch_name_async(client, sem, t) for t in leftover]
+        ):
+            ticker, name = await coro
+            results[ticker] = name
+            if on_result:
+                on_result(ticker, name)
+    return results
+
+
 def main():
-    # Collect all tickers
-    tickers = set()
+    # Read both source CSVs in parallel — polars' Rust parser runs
+    # outside the GIL, so the two reads overlap instead of running back
+    # to back.
+    with ThreadPoolExecutor(2) as pool:
+        fut_jp = pool.submit(pl.read_csv, JP_CSV)
+        fut_comp = (
+            pool.submit(pl.read_csv, COMP_CSV) if os.path.exists(COMP_CSV) else None
+        )
+        jp_df = fut_jp.result()
+        comp_df = fut_comp.result() if fut_comp else None
 
-    # From jp.csv
-    jp_df = pd.read_csv(JP_CSV)
-    for t in jp_df["Ticker"]:
-        tickers.add(normalize_ticker(t))
+    # Collect all tickers (suffix strip vectorized in Rust, sharing the
+    # one _SUFFIX_RE definition)
+    jp_series = (
+        jp_df["Ticker"].str.replace(_SUFFIX_RE.pattern, "").str.strip_chars()
+    )
+    ticker_set = set(jp_series.to_list())
 
     # From portfolio_composition.csv
-    if os.path.exists(COMP_CSV):
-        comp_df = pd.read_csv(COMP_CSV)
-        for t in comp_df["ticker"].unique():
-            tickers.add(normalize_ticker(t))
+    if comp_df is not None:
+        comp_series = (
+            comp_df["ticker"].str.replace(_SUFFIX_RE.pattern, "").str.strip_chars()
+        )
+        ticker_set |= set(comp_series.to_list())
 
-    tickers = sorted(tickers)
+    tickers = sorted(ticker_set)
     print(f"Fetching names for {len(tickers)} tickers...")
 
     # Load existing file to avoid re-fetching known names
     existing = {}
     if os.path.exists(OUTPUT_CSV):
-        existing_df = pd.read_csv(OUTPUT_CSV)
-        for _, row in existing_df.iterrows():
-            if pd.notna(row["Name"]) and row["Name"]:
-                existing[row["Ticker"]] = row["Name"]
+        # Vectorized dict build: two column arrays through one zip instead
+        # of a Series per row via iterrows
+        existing_df = pl.read_csv(OUTPUT_CSV).filter(
+            pl.col("Name").is_not_null() & (pl.col("Name") != "")
+        )
+        existing = dict(
+            zip(existing_df["Ticker"].to_list(), existing_df["Name"].to_list())
+        )
         print(f"  Loaded {len(existing)} existing names from cache")
 
-    results = []
-    for i, ticker in enumerate(tickers, 1):
-        if ticker in existing:
-            name = existing[ticker]
-            print(f"  [{i}/{len(tickers)}] {ticker} -> {name} (cached)")
-        else:
-            name = fetch_name(ticker)
-            print(f"  [{i}/{len(tickers)}] {ticker} -> {name or '???'}")
-            time.sleep(0.3)  # rate limit courtesy
-        results.append({"Ticker": ticker, "Name": name})
-
-    out_df = pd.DataFrame(results)
-    out_df.to_csv(OUTPUT_CSV, index=False)
-    print(f"\nSaved {len(results)} entries to {OUTPUT_CSV}")
+    missing = [t for t in tickers if t not in existing]
+
+    # Stream rows into a side temp file and swap it over the real CSV
+    # only on success — the previous jp_names.csv stays intact if a fetch
+    # crashes mid-run, and fresh names are persisted to the shelve cache
+    # as they resolve, so nothing is lost either way. Counters replace an
+    # in-memory results mapping — nothing downstream needs the rows
+    # again, so there is no point holding 2000+ entries until exit.
+    n_written = 0
+    n_found = 0
+    tmp_csv = OUTPUT_CSV + ".tmp"
+    out_f = open(tmp_csv, "w", newline="", encoding="utf-8")
+    writer = csv.DictWriter(out_f, fieldnames=["Ticker", "Name"])
+    writer.writeheader()
+
+    def record(ticker: str, name: str) -> None:
+        nonlocal n_written, n_found
+        writer.writerow({"Ticker": ticker, "Name": name})
+        out_f.flush()
+        n_written += 1
+        if name:
+            n_found += 1
+
+    try:
+        with shelve.open(NAME_CACHE_DB) as cache:
+            # Back-fill the disk cache with names carried only in the
+            # CSV, so they stay durable independently of the output file.
+            for ticker in tickers:
+                if ticker in existing:
+                    record(ticker, existing[ticker])
+                    code = ticker_to_yf(ticker)
+                    if cache_get(cache, code) is None:
+                        cache_set(cache, code, existing[ticker])
+
+            to_fetch = []
+            n_disk = 0
+            for ticker in missing:
+                hit = cache_get(cache, ticker_to_yf(ticker))
+                if hit is None:
+                    to_fetch.append(ticker)
+                else:
+                    record(ticker, hit)
+                    n_disk += 1
+            if n_disk:
+                print(f"  {n_disk} names from disk cache")
+
+            def record_fresh(ticker: str, name: str) -> None:
+                cache_set(cache, ticker_to_yf(ticker), name)
+                record(ticker, name)
+
+            if to_fetch:
+                print(f"  Fetching {len(to_fetch)} names ({CONCURRENCY_LIMIT} concurrent)...")
+                asyncio.run(fetch_names(to_fetch, on_result=record_fresh))
+    finally:
+        out_f.close()
+
+    os.replace(tmp_csv, OUTPUT_CSV)
+    print(f"\nSaved {n_written} entries to {OUTPUT_CSV}")
 
     # Summary
-    found = sum(1 for r in results if r["Name"])
-    print(f"Names found: {found}/{len(results)}")
+    print(f"Names found: {n_found}/{n_written}")
 
 
 if __name__ == "__main__":